@@ -9,35 +9,106 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any, Callable, Dict, Mapping, cast
 
-from platformdirs import user_config_dir
-
 from .schema import PodlogConfig, build_config, default_config
 
-try:  # pragma: no cover
-    import tomllib  # type: ignore[attr-defined]
-except ModuleNotFoundError:  # pragma: no cover
-    import tomli as tomllib  # type: ignore[no-redef]
+_ENV_PREFIX = "PODLOG__"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+_SKIP_DISCOVERY_ENV = "PODLOG_SKIP_DISCOVERY"
+_CONFIG_FILENAMES = ("podlog.toml", "podlog.yaml", "podlog.yml")
 
-try:  # pragma: no cover
-    yaml_module = importlib.import_module("yaml")
-except ModuleNotFoundError:  # pragma: no cover
-    yaml_module = None
+# Parsers are imported on first use so inline ``configure({...})`` calls never
+# pay for them. ``_yaml_checked`` distinguishes "not imported yet" from
+# "PyYAML is not installed".
+_tomllib: ModuleType | None = None
+_yaml: ModuleType | None = None
+_yaml_checked = False
 
-yaml: ModuleType | None = yaml_module
 
+def _get_tomllib() -> ModuleType:
+    global _tomllib
+    if _tomllib is None:
+        try:  # pragma: no cover
+            _tomllib = importlib.import_module("tomllib")
+        except ModuleNotFoundError:  # pragma: no cover
+            _tomllib = importlib.import_module("tomli")
+    return _tomllib
+
+
+def _get_yaml() -> ModuleType | None:
+    global _yaml, _yaml_checked
+    if not _yaml_checked:
+        try:  # pragma: no cover
+            _yaml = importlib.import_module("yaml")
+        except ModuleNotFoundError:  # pragma: no cover
+            _yaml = None
+        _yaml_checked = True
+    return _yaml
+
+
+def user_config_dir(appname: str) -> str:
+    """Return the per-user configuration directory for ``appname``."""
+
+    from platformdirs import user_config_dir as _user_config_dir
+
+    return _user_config_dir(appname)
+
+
+# Parsed payloads, stored as JSON text, keyed by path and validated against
+# the file's stat signature so unchanged files are not re-parsed on every
+# ``configure()``. Each hit decodes a fresh payload: the merged tree ends up in
+# ``PodlogConfig.raw`` and must not alias the cache.
+_FILE_CACHE: Dict[Path, tuple[tuple[int, int], str]] = {}
 
-_ENV_PREFIX = "PODLOG__"
+
+def _as_json(value: Any) -> str | None:
+    """Render ``value`` as JSON, or ``None`` if it does not round-trip exactly."""
+
+    try:
+        rendered = json.dumps(value, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    # TOML dates have no JSON form, tuples come back as lists and NaN never
+    # compares equal; such values are simply not cached.
+    return rendered if json.loads(rendered) == value else None
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cached(path: Path, reader: Callable[[Path], Dict[str, Any]]) -> Dict[str, Any]:
+    signature = _file_signature(path)
+    if signature is None:
+        _FILE_CACHE.pop(path, None)
+        return {}
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return json.loads(cached[1])
+    payload = reader(path)
+    rendered = _as_json(payload)
+    if rendered is None:
+        _FILE_CACHE.pop(path, None)
+    else:
+        _FILE_CACHE[path] = (signature, rendered)
+    return payload
 
 
 def _load_toml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
     with path.open("rb") as fh:
-        return tomllib.load(fh)
+        return _get_tomllib().load(fh)
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    if yaml is None or not path.exists():
+    if not path.exists():
+        return {}
+    yaml = _get_yaml()
+    if yaml is None:
         return {}
     with path.open("r", encoding="utf-8") as fh:
         loader = getattr(yaml, "safe_load", None)
@@ -51,52 +122,61 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
 
 
 def _merge(base: Dict[str, Any], incoming: Mapping[str, Any]) -> Dict[str, Any]:
-    for key, value in incoming.items():
-        existing = base.get(key)
-        if isinstance(value, Mapping) and isinstance(existing, dict):
-            _merge(existing, value)
-        elif isinstance(value, Mapping) and isinstance(existing, Mapping):
-            nested = dict(existing)
-            base[key] = _merge(nested, value)
-        elif isinstance(value, Mapping):
-            base[key] = _merge({}, value)
-        else:
-            base[key] = value
+    stack: list[tuple[Dict[str, Any], Mapping[str, Any]]] = [(base, incoming)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if not isinstance(value, Mapping):
+                target[key] = value
+                continue
+            existing = target.get(key)
+            if not isinstance(existing, dict):
+                existing = {}
+                target[key] = existing
+            stack.append((existing, value))
     return base
 
 
-def _load_user_config() -> Dict[str, Any]:
-    cfg_dir = Path(user_config_dir("podlog"))
+_CONFIG_READERS: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    ".toml": _load_toml,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+}
+
+
+def _load_config_file(path: Path) -> Dict[str, Any]:
+    return _read_cached(path, _CONFIG_READERS[path.suffix])
+
+
+def _user_config_path() -> Path:
+    return Path(user_config_dir("podlog"))
+
+
+def _load_user_config(cfg_dir: Path | None = None) -> Dict[str, Any]:
+    cfg_dir = cfg_dir if cfg_dir is not None else _user_config_path()
     if not cfg_dir.exists():
         return {}
     data: Dict[str, Any] = {}
-    for filename in ("podlog.toml", "podlog.yaml", "podlog.yml"):
-        payload = (
-            _load_toml(cfg_dir / filename)
-            if filename.endswith(".toml")
-            else _load_yaml(cfg_dir / filename)
-        )
+    for filename in _CONFIG_FILENAMES:
+        payload = _load_config_file(cfg_dir / filename)
         if payload:
-            data = _merge(data, payload)
+            _merge(data, payload)
     return data
 
 
-def _load_local_config() -> Dict[str, Any]:
-    cwd = Path.cwd()
+def _load_local_config(cwd: Path | None = None) -> Dict[str, Any]:
+    cwd = cwd if cwd is not None else Path.cwd()
     data: Dict[str, Any] = {}
-    for filename in ("podlog.toml", "podlog.yaml", "podlog.yml"):
-        path = cwd / filename
-        payload = _load_toml(path) if filename.endswith(".toml") else _load_yaml(path)
+    for filename in _CONFIG_FILENAMES:
+        payload = _load_config_file(cwd / filename)
         if payload:
-            data = _merge(data, payload)
+            _merge(data, payload)
     return data
 
 
-def _load_pyproject() -> Dict[str, Any]:
-    path = Path("pyproject.toml")
-    if not path.exists():
-        return {}
-    data = _load_toml(path)
+def _load_pyproject(cwd: Path | None = None) -> Dict[str, Any]:
+    path = (cwd if cwd is not None else Path.cwd()) / "pyproject.toml"
+    data = _read_cached(path, _load_toml)
     tool = data.get("tool", {})
     if not isinstance(tool, Mapping):
         return {}
@@ -109,8 +189,10 @@ def _load_pyproject() -> Dict[str, Any]:
 def _coerce_value(value: str) -> Any:
     stripped = value.strip()
     lowered = stripped.lower()
-    if lowered in {"true", "false"}:
-        return lowered == "true"
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
     try:
         return int(stripped)
     except ValueError:
@@ -126,12 +208,18 @@ def _coerce_value(value: str) -> Any:
     return stripped
 
 
-def _env_config() -> Dict[str, Any]:
+def _env_items() -> list[tuple[str, str]]:
+    return [(key, value) for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)]
+
+
+def _env_config(items: list[tuple[str, str]] | None = None) -> Dict[str, Any]:
+    if items is None:
+        items = _env_items()
     data: Dict[str, Any] = {}
-    for env_key, raw_value in os.environ.items():
-        if not env_key.startswith(_ENV_PREFIX):
-            continue
-        path = env_key[len(_ENV_PREFIX) :].split("__")
+    if not items:
+        return data
+    for env_key, raw_value in items:
+        path = env_key[_ENV_PREFIX_LEN:].split("__")
         target: Dict[str, Any] = data
         for segment in path[:-1]:
             seg = segment.lower()
@@ -149,15 +237,39 @@ def _merge_overrides(*mappings: Mapping[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _discovery_disabled() -> bool:
+    return os.environ.get(_SKIP_DISCOVERY_ENV, "").strip().lower() in {"1", "true", "yes"}
+
+
+def _has_config_files(cfg_dir: Path, cwd: Path) -> bool:
+    candidates = [cfg_dir / name for name in _CONFIG_FILENAMES]
+    candidates.extend(cwd / name for name in _CONFIG_FILENAMES)
+    candidates.append(cwd / "pyproject.toml")
+    return any(_file_signature(path) is not None for path in candidates)
+
+
 def load_configuration(overrides: Dict[str, Any] | None = None) -> PodlogConfig:
-    """Load configuration from supported sources in precedence order."""
+    """Load configuration from supported sources in precedence order.
+
+    Setting ``PODLOG_SKIP_DISCOVERY=1`` skips configuration files and
+    ``PODLOG__*`` environment variables so only ``overrides`` apply.
+    """
 
     overrides = overrides or {}
+    if _discovery_disabled():
+        return build_config(_merge_overrides(overrides))
+
+    env_items = _env_items()
+    cfg_dir = _user_config_path()
+    cwd = Path.cwd()
+    if not env_items and not _has_config_files(cfg_dir, cwd):
+        return build_config(_merge_overrides(overrides))
+
     merged = _merge_overrides(
-        _load_user_config(),
-        _load_local_config(),
-        _load_pyproject(),
-        _env_config(),
+        _load_user_config(cfg_dir),
+        _load_local_config(cwd),
+        _load_pyproject(cwd),
+        _env_config(env_items),
         overrides,
     )
     return build_config(merged)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
 from ..handlers.queue_async import QueueConfig
 from ..utils.paths import DateFolderMode, DateFolderStrategy
@@ -61,6 +61,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "queue_maxsize": 1000,
         "flush_interval_ms": 500,
         "graceful_shutdown_timeout_s": 5.0,
+        "use_deque_queue": False,
     },
     "context": {
         "enabled": True,
@@ -69,10 +70,15 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+# ``DEFAULT_CONFIG`` is plain JSON data, so a JSON round-trip yields an
+# independent copy considerably faster than ``copy.deepcopy``.
+_DEFAULT_JSON = json.dumps(DEFAULT_CONFIG)
+
+
 def default_config() -> Dict[str, Any]:
     """Return a deep copy of the default configuration mapping."""
 
-    return deepcopy(DEFAULT_CONFIG)
+    return json.loads(_DEFAULT_JSON)
 
 
 @dataclass(slots=True)
@@ -111,6 +117,7 @@ class HandlerSpec:
     formatter: str
     filters: List[str] = field(default_factory=list)
     options: Dict[str, Any] = field(default_factory=dict)
+    queue_group: str = "default"
 
 
 @dataclass(slots=True)
@@ -151,6 +158,9 @@ class PodlogConfig:
     force_config: bool
     incremental: bool
     raw: Dict[str, Any] = field(repr=False)
+    # Integer levels keyed by ``("handler" | "logger" | "override", name)`` and
+    # ``("root", "root")``; refilled on every ``validation.resolve_levels`` call.
+    resolved_levels: Dict[Tuple[str, str], int] = field(default_factory=dict, repr=False, compare=False)
 
     def formatter(self, name: str) -> FormatterSpec:
         return self.formatters[name]
@@ -192,6 +202,9 @@ def _to_filters(data: Mapping[str, Any]) -> Dict[str, FilterSpec]:
     return filters
 
 
+_HANDLER_SPEC_KEYS = frozenset({"type", "level", "formatter", "filters", "queue_group"})
+
+
 def _to_handlers(data: Mapping[str, Any]) -> tuple[Dict[str, HandlerSpec], List[str]]:
     handlers: Dict[str, HandlerSpec] = {}
     enabled_raw = data.get("enabled")
@@ -207,11 +220,12 @@ def _to_handlers(data: Mapping[str, Any]) -> tuple[Dict[str, HandlerSpec], List[
         kind = str(payload.get("type", "console"))
         level = payload.get("level", "INFO")
         formatter = payload.get("formatter", "text.default")
-        filters = [str(f) for f in payload.get("filters", [])] if "filters" in payload else []
+        raw_filters = payload.get("filters")
+        filters = [str(f) for f in raw_filters] if raw_filters is not None else []
         options = {
             key: value
             for key, value in payload.items()
-            if key not in {"type", "level", "formatter", "filters"}
+            if key not in _HANDLER_SPEC_KEYS
         }
         handlers[name] = HandlerSpec(
             name=name,
@@ -219,7 +233,8 @@ def _to_handlers(data: Mapping[str, Any]) -> tuple[Dict[str, HandlerSpec], List[
             level=level,
             formatter=str(formatter),
             filters=filters,
-            options=dict(options),
+            options=options,
+            queue_group=str(payload.get("queue_group", "default")),
         )
 
     if not enabled:
@@ -276,6 +291,7 @@ def _to_async(data: Mapping[str, Any]) -> QueueConfig:
         queue_maxsize=int(data.get("queue_maxsize", 1000)),
         flush_interval_ms=int(data.get("flush_interval_ms", 500)),
         graceful_shutdown_timeout_s=float(data.get("graceful_shutdown_timeout_s", 5.0)),
+        use_deque_queue=bool(data.get("use_deque_queue", False)),
     )
 
 
@@ -304,7 +320,9 @@ def build_config(data: Mapping[str, Any]) -> PodlogConfig:
     if not root_logger.handlers:
         root_logger.handlers = enabled.copy()
 
-    raw_copy: Dict[str, Any] = deepcopy({k: v for k, v in data.items()})
+    # ``data`` is owned by the loader pipeline and never mutated afterwards, so
+    # keep a reference rather than copying the whole tree.
+    raw: Dict[str, Any] = data if isinstance(data, dict) else dict(data)
 
     return PodlogConfig(
         paths=paths,
@@ -321,5 +339,5 @@ def build_config(data: Mapping[str, Any]) -> PodlogConfig:
         disable_existing_loggers=disable_existing,
         force_config=force_config,
         incremental=incremental,
-        raw=raw_copy,
+        raw=raw,
     )
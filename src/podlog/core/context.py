@@ -5,36 +5,113 @@ from __future__ import annotations
 import inspect
 import json
 import logging
-from dataclasses import dataclass, field
+import re
 from typing import Any, Dict, Mapping, MutableMapping, Tuple
 
 from .levels import TRACE_LEVEL_NUM
 
+_RESERVED_EXTRA_KEYS = frozenset({"context", "extra_kvs"})
+# ``key=value`` pairs within whitespace separated tokens; the key stops at the
+# first ``=`` so values may themselves contain ``=``.
+_CTX_PAIR_RE = re.compile(r"([^\s=]*)=(\S*)")
+# Values whose rendering cannot change behind the adapter's back; context and
+# buffered extras text are only cached when every value is one of these.
+_IMMUTABLE_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _render_extra(value: Any) -> str:
+    if isinstance(value, (dict, list)):
+        try:
+            return json.dumps(value, ensure_ascii=False)
+        except Exception:
+            return repr(value)
+    try:
+        return str(value)
+    except Exception:
+        return repr(value)
+
 
-@dataclass(slots=True)
 class ContextState:
     """Container for persistent context and buffered extras."""
 
-    context: Dict[str, Any] = field(default_factory=dict)
-    extras: Dict[str, Any] = field(default_factory=dict)
+    # Hand-written rather than a dataclass: one is created per adapter, and a
+    # plain ``__init__`` avoids the default-factory dispatch.
+    __slots__ = ("context", "extras", "_context_str", "_extras_str")
+
+    def __init__(
+        self,
+        context: Dict[str, Any] | None = None,
+        extras: Dict[str, Any] | None = None,
+    ) -> None:
+        self.context: Dict[str, Any] = context if context is not None else {}
+        self.extras: Dict[str, Any] = extras if extras is not None else {}
+        self._context_str: str | None = None
+        self._extras_str: str | None = None
+
+    def __repr__(self) -> str:
+        return f"ContextState(context={self.context!r}, extras={self.extras!r})"
 
     def context_string(self) -> str:
-        items = sorted(self.context.items(), key=lambda kv: kv[0])
-        return " ".join(f"{key}={value}" for key, value in items) if items else "-"
+        """Return the rendered context (``"-"`` when there is none).
+
+        Cached under the same immutable-scalar rule as
+        :meth:`buffered_extras_text`.
+        """
+
+        cached = self._context_str
+        if cached is None:
+            # Keys are unique, so plain tuple ordering never compares values.
+            items = sorted(self.context.items())
+            cached = " ".join(f"{key}={value}" for key, value in items) if items else "-"
+            if all(type(value) in _IMMUTABLE_SCALARS for _, value in items):
+                self._context_str = cached
+        return cached
+
+    def invalidate_context(self) -> None:
+        """Drop the cached :meth:`context_string` after ``context`` changes."""
+
+        self._context_str = None
+
+    def invalidate_extras(self) -> None:
+        """Drop the cached :meth:`buffered_extras_text` after ``extras`` changes."""
+
+        self._extras_str = None
 
     def extras_text(self, data: Mapping[str, Any]) -> str:
         if not data:
             return "-"
-        parts: list[str] = []
-        for key, value in data.items():
-            if key in {"context", "extra_kvs"}:
-                continue
-            try:
-                rendered = json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else str(value)
-            except Exception:
-                rendered = repr(value)
-            parts.append(f"{key}={rendered}")
-        return " ".join(parts)
+        return " ".join(
+            f"{key}={_render_extra(value)}"
+            for key, value in data.items()
+            if key not in _RESERVED_EXTRA_KEYS
+        )
+
+    def buffered_extras_text(self) -> str:
+        """Return the rendered buffered extras (``""`` when there are none).
+
+        The text is cached only while every value is an immutable scalar, so
+        mutable values such as lists are rendered with their live contents.
+        """
+
+        cached = self._extras_str
+        if cached is None:
+            extras = self.extras
+            cached = self.extras_text(extras) if extras else ""
+            if all(type(value) in _IMMUTABLE_SCALARS for value in extras.values()):
+                self._extras_str = cached
+        return cached
+
+
+class ContextLogRecord(logging.LogRecord):
+    """``LogRecord`` carrying class-level context defaults.
+
+    Defaults live on the class rather than the instance ``__dict__`` so
+    ``Logger.makeRecord`` still accepts ``extra={"context": ...}`` without
+    raising ``KeyError`` for an overwritten attribute.
+    """
+
+    context = "-"
+    extra_kvs = "-"
 
 
 class ContextFilter(logging.Filter):
@@ -64,18 +141,23 @@ class ContextAdapter(logging.LoggerAdapter):
             self._state.context = self._parse_ctx_string(ctx)
         else:
             self._state.context = dict(ctx)
+        self._state.invalidate_context()
 
     def add_context(self, **kwargs: Any) -> None:
         self._state.context.update(kwargs)
+        self._state.invalidate_context()
 
     def clear_extra(self) -> None:
         self._state.extras.clear()
+        self._state.invalidate_extras()
 
     def add_extra(self, *args: Any, **kwargs: Any) -> None:
-        for key, value in kwargs.items():
-            self._state.extras[key] = value
+        self._state.invalidate_extras()
+        if kwargs:
+            self._state.extras.update(kwargs)
 
         if not args:
+            # Keyword-only calls never need caller-frame name inference.
             return
 
         frame = inspect.currentframe()
@@ -104,44 +186,51 @@ class ContextAdapter(logging.LoggerAdapter):
 
     # -- LoggingAdapter API -------------------------------------------------
     def process(self, msg: str, kwargs: MutableMapping[str, Any]) -> Tuple[str, MutableMapping[str, Any]]:
+        state = self._state
         call_extra = kwargs.get("extra")
-        merged: Dict[str, Any] = dict(self._state.extras)
-        if isinstance(call_extra, Mapping):
-            merged.update(call_extra)
+        merged: Dict[str, Any]
+        if isinstance(call_extra, Mapping) and call_extra:
+            merged = {**state.extras, **call_extra}
+            extra_kvs = state.extras_text(merged)
+        else:
+            # Always hand logging a fresh dict so the reserved keys below never
+            # leak back into the buffered extras.
+            merged = dict(state.extras)
+            extra_kvs = state.buffered_extras_text()
 
-        merged["context"] = self._state.context_string()
-        merged["extra_kvs"] = self._state.extras_text(merged)
+        merged["context"] = state.context_string()
+        merged["extra_kvs"] = extra_kvs
         kwargs["extra"] = merged
         return msg, kwargs
 
     def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        if self.logger.isEnabledFor(TRACE_LEVEL_NUM):
-            self.log(TRACE_LEVEL_NUM, msg, *args, **kwargs)
+        logger = self.logger
+        if logger.isEnabledFor(TRACE_LEVEL_NUM):
+            msg, kwargs = self.process(msg, kwargs)
+            # Skip this frame so the record points at the caller, not podlog.
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+            logger._log(TRACE_LEVEL_NUM, msg, args, **kwargs)
 
     # -- Helpers ------------------------------------------------------------
     @staticmethod
     def _parse_ctx_string(value: str) -> Dict[str, Any]:
-        result: Dict[str, Any] = {}
-        parts = [part for part in value.strip().split() if part]
-        for part in parts:
-            if "=" not in part:
-                continue
-            key, raw = part.split("=", 1)
-            result[key] = raw
+        result: Dict[str, Any] = {key: raw for key, raw in _CTX_PAIR_RE.findall(value)}
         return result or {"_ctx": value}
 
 
-def ensure_context_filter(logger: logging.Logger) -> None:
-    """Attach the :class:`ContextFilter` to ``logger`` if missing."""
+def install_context_record_factory() -> None:
+    """Make :class:`ContextLogRecord` the record factory when none is customised.
 
-    for existing in logger.filters:
-        if isinstance(existing, ContextFilter):
-            return
-    logger.addFilter(ContextFilter())
+    A user-supplied factory is left untouched; formatters fall back to ``"-"``
+    for missing context attributes in that case.
+    """
+
+    if logging.getLogRecordFactory() is logging.LogRecord:
+        logging.setLogRecordFactory(ContextLogRecord)
 
 
 def inject_context(logger: logging.Logger, *, base_context: Mapping[str, Any] | None = None) -> ContextAdapter:
-    """Return a :class:`ContextAdapter` attached to ``logger`` with filter."""
+    """Return a :class:`ContextAdapter` attached to ``logger``."""
 
-    ensure_context_filter(logger)
+    install_context_record_factory()
     return ContextAdapter(logger, base_context=base_context)
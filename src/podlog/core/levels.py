@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Dict
 
 TRACE_LEVEL_NAME = "TRACE"
 TRACE_LEVEL_NUM = 5
@@ -32,15 +32,26 @@ def register_trace_level(enable: bool = True) -> None:
         logging.Logger.trace = trace  # type: ignore[assignment]
 
 
+# Only successful lookups are cached so names registered later via
+# ``logging.addLevelName`` are still picked up instead of the INFO fallback.
+_LEVEL_CACHE: Dict[str, int] = {}
+
+
 def get_level_by_name(name: str) -> int:
     """Resolve a logging level from a friendly name."""
 
-    if name.upper() == TRACE_LEVEL_NAME:
-        return TRACE_LEVEL_NUM
-    if name.isdigit():
-        return int(name)
-    resolved = logging.getLevelName(name.upper())
+    cached = _LEVEL_CACHE.get(name)
+    if cached is not None:
+        return cached
+    upper = name.upper()
+    if upper == TRACE_LEVEL_NAME:
+        resolved: object = TRACE_LEVEL_NUM
+    elif name.isdigit():
+        resolved = int(name)
+    else:
+        resolved = logging.getLevelName(upper)
     if isinstance(resolved, int):
+        _LEVEL_CACHE[name] = resolved
         return resolved
     return logging.INFO
 
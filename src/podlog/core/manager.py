@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Set
+from itertools import chain
+from typing import Dict, List, Set
 
 from ..config.schema import PodlogConfig
 from ..handlers.queue_async import QueueCoordinator
-from .context import ContextAdapter, inject_context
-from .levels import ensure_level, register_trace_level
-from .registry import build_filter, build_formatter, build_handler
+from .context import ContextAdapter, inject_context, install_context_record_factory
+from .levels import register_trace_level
+from .registry import build_filters, build_formatters, build_handler
 from .validation import validate_configuration
 
 
@@ -24,6 +25,8 @@ class LogManager:
         self._configured_loggers: Set[str] = set()
         self._formatters_cache: Dict[str, logging.Formatter] = {}
         self._filters_cache: Dict[str, logging.Filter] = {}
+        self._capture_warnings: bool | None = None
+        self._trace_registered = False
 
     # ------------------------------------------------------------------
     def configure(self, config: PodlogConfig) -> None:
@@ -33,21 +36,24 @@ class LogManager:
         self._teardown()
 
         self._config = config
-        register_trace_level(config.levels.enable_trace)
-        logging.captureWarnings(config.capture_warnings)
-
-        self._formatters_cache = {
-            name: build_formatter(spec) for name, spec in config.formatters.items()
-        }
-        self._filters_cache = {
-            name: build_filter(spec) for name, spec in config.filters.items()
-        }
+        if config.levels.enable_trace and not self._trace_registered:
+            register_trace_level(True)
+            self._trace_registered = True
+        install_context_record_factory()
+        # ``captureWarnings`` swaps ``warnings.showwarning`` globally; only touch
+        # it when the requested state actually changes.
+        if config.capture_warnings != self._capture_warnings:
+            logging.captureWarnings(config.capture_warnings)
+            self._capture_warnings = config.capture_warnings
+
+        self._formatters_cache = build_formatters(config.formatters)
+        self._filters_cache = build_filters(config.filters)
 
         self._real_handlers = {}
         for name in config.handlers_enabled:
             spec = config.handlers[name]
             handler = build_handler(spec, config.paths)
-            handler.setLevel(ensure_level(spec.level))
+            handler.setLevel(config.resolved_levels[("handler", name)])
             formatter = self._formatters_cache[spec.formatter]
             handler.setFormatter(formatter)
             for filter_name in spec.filters:
@@ -58,15 +64,27 @@ class LogManager:
         self._coordinators = {}
         async_cfg = config.async_config if config.async_config.use_queue_listener else None
         if async_cfg:
-            for name, handler in self._real_handlers.items():
-                coordinator = QueueCoordinator(config=async_cfg, handlers=[handler])
+            # One queue/listener thread per ``queue_group``; records stay routed
+            # to their own handler through ``handler_for``.
+            groups: Dict[str, List[str]] = {}
+            for name in self._real_handlers:
+                groups.setdefault(config.handlers[name].queue_group, []).append(name)
+            for group, names in groups.items():
+                coordinator = QueueCoordinator(
+                    config=async_cfg,
+                    handlers=[self._real_handlers[name] for name in names],
+                )
                 coordinator.start()
-                queue_handler = coordinator.handler()
-                queue_handler.setLevel(handler.level)
-                for filt in handler.filters:
-                    queue_handler.addFilter(filt)
-                self._coordinators[name] = coordinator
-                self._handlers[name] = queue_handler
+                for name in names:
+                    handler = self._real_handlers[name]
+                    queue_handler = coordinator.handler_for(handler)
+                    queue_handler.setLevel(handler.level)
+                    # Filters run only on the producer side: rejected records are
+                    # never enqueued and the listener thread goes straight to emit.
+                    queue_handler.filters = list(handler.filters)
+                    handler.filters = []
+                    self._handlers[name] = queue_handler
+                self._coordinators[group] = coordinator
         else:
             self._handlers = dict(self._real_handlers)
 
@@ -83,6 +101,7 @@ class LogManager:
 
         self._teardown()
         self._config = None
+        self._capture_warnings = None
 
     # ------------------------------------------------------------------
     def get_logger(self, name: str) -> logging.Logger:
@@ -102,32 +121,33 @@ class LogManager:
 
     # ------------------------------------------------------------------
     def _teardown(self) -> None:
-        handlers_to_remove = set(self._handlers.values()) | set(self._real_handlers.values())
-        if handlers_to_remove:
+        # Queue handlers first, then the real handlers behind them; keyed by
+        # identity so a handler present in both maps is only closed once.
+        owned = {
+            id(handler): handler
+            for handler in chain(self._handlers.values(), self._real_handlers.values())
+        }
+        if owned:
             root_logger = logging.getLogger()
             for handler in list(root_logger.handlers):
-                if handler in handlers_to_remove:
+                if id(handler) in owned:
                     root_logger.removeHandler(handler)
+            logger_dict = root_logger.manager.loggerDict
             for logger_name in self._configured_loggers:
                 if logger_name == "root":
                     continue
-                logger = logging.getLogger(logger_name)
+                logger = logger_dict.get(logger_name)
+                if not isinstance(logger, logging.Logger):
+                    continue
                 for handler in list(logger.handlers):
-                    if handler in handlers_to_remove:
+                    if id(handler) in owned:
                         logger.removeHandler(handler)
 
         for coordinator in self._coordinators.values():
             coordinator.stop()
         self._coordinators.clear()
 
-        for handler in self._handlers.values():
-            try:
-                handler.flush()
-            except Exception:
-                pass
-            handler.close()
-
-        for handler in self._real_handlers.values():
+        for handler in owned.values():
             try:
                 handler.flush()
             except Exception:
@@ -142,8 +162,7 @@ class LogManager:
         assert self._config is not None
         root_logger = logging.getLogger()
         root_logger.handlers = []
-        root_level = ensure_level(self._config.levels.root_level or self._config.root_logger.level)
-        root_logger.setLevel(root_level)
+        root_logger.setLevel(self._config.resolved_levels[("root", "root")])
         for handler_name in self._config.root_logger.handlers:
             handler = self._handlers.get(handler_name)
             if handler is not None:
@@ -156,10 +175,7 @@ class LogManager:
         for name, spec in self._config.loggers.items():
             logger = logging.getLogger(name)
             logger.handlers = []
-            level_value = spec.level
-            if name in self._config.levels.overrides:
-                level_value = self._config.levels.overrides[name]
-            logger.setLevel(ensure_level(level_value))
+            logger.setLevel(self._config.resolved_levels[("logger", name)])
             for handler_name in spec.handlers:
                 handler = self._handlers.get(handler_name)
                 if handler is not None:
@@ -169,19 +185,20 @@ class LogManager:
 
     def _apply_level_overrides(self) -> None:
         assert self._config is not None
-        for name, level in self._config.levels.overrides.items():
+        for name in self._config.levels.overrides:
             if name in self._config.loggers:
                 continue
             logger = logging.getLogger(name)
-            logger.setLevel(ensure_level(level))
+            logger.setLevel(self._config.resolved_levels[("override", name)])
 
     def _disable_unconfigured_loggers(self) -> None:
-        configured = set(self._configured_loggers)
+        configured = self._configured_loggers
         manager = logging.getLogger().manager
-        for name in list(manager.loggerDict.keys()):
-            if not name or name in configured:
+        # Snapshot, then touch logger objects directly; placeholders are not
+        # loggers yet and ``getLogger`` would take the module lock per name.
+        for name, logger in tuple(manager.loggerDict.items()):
+            if not name or name in configured or not isinstance(logger, logging.Logger):
                 continue
-            logger = logging.getLogger(name)
             logger.disabled = True
 
 
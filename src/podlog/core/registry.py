@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import logging.handlers
 from socket import SocketKind
-from typing import Any, Callable, Dict, Iterable
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping
 
 from ..config.schema import FilterSpec, FormatterSpec, HandlerSpec, PathsConfig
 from ..formatters.csvfmt import CSVFormatter
@@ -33,6 +33,8 @@ __all__ = [
     "build_formatter",
     "build_handler",
     "build_filter",
+    "build_formatters",
+    "build_filters",
 ]
 
 
@@ -42,9 +44,19 @@ class LevelsAllowFilter(logging.Filter):
     def __init__(self, levels: Iterable[int]) -> None:
         super().__init__()
         self.levels = {level for level in levels}
+        # Byte lookup table for the usual 0-255 range; anything outside it
+        # (custom levels) falls back to the set.
+        lut = bytearray(256)
+        for level in self.levels:
+            if 0 <= level < 256:
+                lut[level] = 1
+        self._lut = bytes(lut)
 
     def filter(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
-        return record.levelno in self.levels
+        levelno = record.levelno
+        if 0 <= levelno < 256:
+            return self._lut[levelno] == 1
+        return levelno in self.levels
 
 
 class MinLevelFilter(logging.Filter):
@@ -98,6 +110,30 @@ FORMATTER_BUILDERS: Dict[str, FormatterBuilder] = {
 }
 
 
+# Within one ``build_formatters``/``build_filters`` call, structurally identical
+# specs share one instance. CSV is excluded because ``CSVFormatter`` tracks
+# header emission per instance; handlers are never shared as they own streams.
+_SHARED_FORMATTER_KINDS = frozenset({"text", "jsonl", "logfmt"})
+_SHARED_FILTER_KINDS = frozenset({"exact", "min", "levels"})
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = tuple(_freeze(item) for item in value)
+        return (type(value).__name__, items)
+    hash(value)
+    return value
+
+
+def _spec_key(kind: str, options: Mapping[str, Any]) -> Hashable | None:
+    try:
+        return (kind, _freeze(options))
+    except TypeError:
+        return None
+
+
 def build_formatter(spec: FormatterSpec) -> logging.Formatter:
     builder = FORMATTER_BUILDERS.get(spec.kind)
     if builder is None:
@@ -105,6 +141,23 @@ def build_formatter(spec: FormatterSpec) -> logging.Formatter:
     return builder(spec)
 
 
+def build_formatters(specs: Mapping[str, FormatterSpec]) -> Dict[str, logging.Formatter]:
+    """Build named formatters, sharing one instance between identical specs."""
+
+    shared: Dict[Hashable, logging.Formatter] = {}
+    formatters: Dict[str, logging.Formatter] = {}
+    for name, spec in specs.items():
+        key = _spec_key(spec.kind, spec.options) if spec.kind in _SHARED_FORMATTER_KINDS else None
+        if key is None:
+            formatters[name] = build_formatter(spec)
+            continue
+        formatter = shared.get(key)
+        if formatter is None:
+            formatter = shared[key] = build_formatter(spec)
+        formatters[name] = formatter
+    return formatters
+
+
 def _build_file_handler(spec: HandlerSpec, paths: PathsConfig) -> logging.Handler:
     filename = spec.options.get("filename")
     if not filename:
@@ -250,3 +303,20 @@ def build_filter(spec: FilterSpec) -> logging.Filter:
     if builder is None:
         raise ValueError(f"Unknown filter kind: {spec.kind}")
     return builder(spec.params)
+
+
+def build_filters(specs: Mapping[str, FilterSpec]) -> Dict[str, logging.Filter]:
+    """Build named filters, sharing one instance between identical specs."""
+
+    shared: Dict[Hashable, logging.Filter] = {}
+    filters: Dict[str, logging.Filter] = {}
+    for name, spec in specs.items():
+        key = _spec_key(spec.kind, spec.params) if spec.kind in _SHARED_FILTER_KINDS else None
+        if key is None:
+            filters[name] = build_filter(spec)
+            continue
+        filt = shared.get(key)
+        if filt is None:
+            filt = shared[key] = build_filter(spec)
+        filters[name] = filt
+    return filters
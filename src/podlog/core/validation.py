@@ -2,47 +2,84 @@
 
 from __future__ import annotations
 
+from typing import Dict, Iterable, List, Tuple
+
 from ..config.schema import PodlogConfig
+from .levels import ensure_level
 
 
 class ConfigurationError(ValueError):
     """Raised when configuration validation fails."""
 
 
+def _ordered(names: Iterable[str], missing: set[str]) -> List[str]:
+    """Return ``missing`` in the order the names were declared, without duplicates."""
+
+    return list(dict.fromkeys(name for name in names if name in missing))
+
+
 def validate_configuration(config: PodlogConfig) -> None:
-    """Ensure configuration references are consistent."""
+    """Ensure configuration references are consistent.
 
-    missing_handlers = [name for name in config.handlers_enabled if name not in config.handlers]
+    All problems are collected and reported together in one
+    :class:`ConfigurationError`. On success the configured levels are resolved
+    via :func:`resolve_levels`.
+    """
+
+    handler_names = config.handlers.keys()
+    formatter_names = config.formatters.keys()
+    filter_names = config.filters.keys()
+    enabled_set = set(config.handlers_enabled)
+
+    missing_handlers = enabled_set - handler_names
     if missing_handlers:
-        raise ConfigurationError(
-            f"Handlers referenced in 'enabled' but undefined: {', '.join(missing_handlers)}"
-        )
+        names = _ordered(config.handlers_enabled, missing_handlers)
+        raise ConfigurationError(f"Handlers referenced in 'enabled' but undefined: {', '.join(names)}")
 
     if not config.handlers_enabled:
         raise ConfigurationError("At least one handler must be enabled")
 
-    enabled_set = set(config.handlers_enabled)
-
+    errors: List[str] = []
     for handler in config.handlers.values():
-        if handler.formatter not in config.formatters:
-            raise ConfigurationError(f"Handler '{handler.name}' references unknown formatter '{handler.formatter}'")
-        for filter_name in handler.filters:
-            if filter_name not in config.filters:
-                raise ConfigurationError(f"Handler '{handler.name}' references unknown filter '{filter_name}'")
-
-    for handler_name in config.root_logger.handlers:
-        if handler_name not in config.handlers:
-            raise ConfigurationError(f"Root logger references unknown handler '{handler_name}'")
-        if handler_name not in enabled_set:
-            raise ConfigurationError(
-                f"Root logger references handler '{handler_name}' which is not enabled"
-            )
-
-    for logger in config.loggers.values():
-        for handler_name in logger.handlers:
-            if handler_name not in config.handlers:
-                raise ConfigurationError(f"Logger '{logger.name}' references unknown handler '{handler_name}'")
-            if handler_name not in enabled_set:
-                raise ConfigurationError(
-                    f"Logger '{logger.name}' references handler '{handler_name}' which is not enabled"
-                )
+        if handler.formatter not in formatter_names:
+            errors.append(f"Handler '{handler.name}' references unknown formatter '{handler.formatter}'")
+        unknown_filters = set(handler.filters) - filter_names
+        for filter_name in _ordered(handler.filters, unknown_filters):
+            errors.append(f"Handler '{handler.name}' references unknown filter '{filter_name}'")
+
+    loggers = [("Root logger", config.root_logger.handlers)]
+    loggers.extend((f"Logger '{logger.name}'", logger.handlers) for logger in config.loggers.values())
+    for label, handlers in loggers:
+        referenced = set(handlers)
+        unknown = referenced - handler_names
+        disabled = (referenced - unknown) - enabled_set
+        for handler_name in _ordered(handlers, unknown):
+            errors.append(f"{label} references unknown handler '{handler_name}'")
+        for handler_name in _ordered(handlers, disabled):
+            errors.append(f"{label} references handler '{handler_name}' which is not enabled")
+
+    if errors:
+        raise ConfigurationError("; ".join(errors))
+
+    resolve_levels(config)
+
+
+def resolve_levels(config: PodlogConfig) -> Dict[Tuple[str, str], int]:
+    """Resolve every configured level to an ``int``.
+
+    Results are stored on ``config.resolved_levels`` for the manager to apply.
+    They are recomputed on every call so edits to the level settings take
+    effect on the next ``configure``.
+    """
+
+    resolved = config.resolved_levels
+    resolved.clear()
+    overrides = config.levels.overrides
+    for name, handler in config.handlers.items():
+        resolved[("handler", name)] = ensure_level(handler.level)
+    resolved[("root", "root")] = ensure_level(config.levels.root_level or config.root_logger.level)
+    for name, logger in config.loggers.items():
+        resolved[("logger", name)] = ensure_level(overrides.get(name, logger.level))
+    for name, level in overrides.items():
+        resolved[("override", name)] = ensure_level(level)
+    return resolved
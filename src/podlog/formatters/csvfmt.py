@@ -5,12 +5,16 @@ from __future__ import annotations
 import csv
 import io
 import logging
-from typing import Iterable, Sequence
+import operator
+import threading
+from typing import Any, Callable, Iterable, Sequence, Tuple
 
 __all__ = ["CSVFormatter"]
 
 _DEFAULT_FIELDS = ("ts", "level", "name", "context", "message")
 
+_FieldGetter = Callable[[logging.LogRecord], str]
+
 
 class CSVFormatter(logging.Formatter):
     """Formatter that renders records as CSV rows."""
@@ -28,29 +32,48 @@ class CSVFormatter(logging.Formatter):
         self.extra_fields = list(extra_fields or [])
         self.include_header = include_header
         self._header_emitted = False
+        self._getters = tuple(self._make_getter(field) for field in self.fields)
+        self._extra = tuple(self.extra_fields)
+        # Formatters may be shared by handlers running on different threads, so
+        # each thread reuses its own buffer/writer pair.
+        self._local = threading.local()
 
-    def _value_for(self, record: logging.LogRecord, field: str) -> str:
+    def _make_getter(self, field: str) -> _FieldGetter:
         if field == "ts":
-            return self.formatTime(record, self.datefmt)
+            return lambda record: self.formatTime(record, self.datefmt)
         if field == "level":
-            return record.levelname
+            return operator.attrgetter("levelname")
         if field == "name":
-            return record.name
+            return operator.attrgetter("name")
         if field == "message":
-            return record.getMessage()
-        return str(getattr(record, field, ""))
+            return operator.methodcaller("getMessage")
+        # Read the instance ``__dict__`` so ``ContextLogRecord``'s class-level
+        # ``"-"`` defaults do not fill the column, matching the JSONL formatter.
+        return lambda record: str(record.__dict__.get(field, ""))
+
+    def _buffer(self) -> Tuple[io.StringIO, Any]:
+        local = self._local
+        buffer = getattr(local, "buffer", None)
+        if buffer is None:
+            buffer = local.buffer = io.StringIO()
+            local.writer = csv.writer(buffer)
+        else:
+            buffer.seek(0)
+            buffer.truncate()
+        return buffer, local.writer
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
-        buffer = io.StringIO()
-        writer = csv.writer(buffer)
+        buffer, writer = self._buffer()
 
         if self.include_header and not self._header_emitted:
-            writer.writerow([*self.fields, *self.extra_fields])
             self._header_emitted = True
+            writer.writerow([*self.fields, *self.extra_fields])
 
-        row = [self._value_for(record, field) for field in self.fields]
-        data = record.__dict__
-        row.extend(str(data.get(field, "")) for field in self.extra_fields)
+        row = [getter(record) for getter in self._getters]
+        if self._extra:
+            data = record.__dict__
+            row.extend([str(data.get(field, "")) for field in self._extra])
         writer.writerow(row)
 
-        return buffer.getvalue().strip("\n")
+        # Drop the writer's trailing "\r\n" line terminator.
+        return buffer.getvalue()[:-2]
@@ -4,35 +4,41 @@ from __future__ import annotations
 
 import json
 import logging
+import operator
 from typing import Any, Iterable, MutableMapping
 
 __all__ = ["JSONLinesFormatter"]
 
-_STANDARD_ATTRS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "asctime",
-    "context",
-    "extra_kvs",
-}
+_STANDARD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "asctime",
+        "context",
+        "extra_kvs",
+    }
+)
+
+
+_CORE_FIELDS = operator.itemgetter("levelname", "name")
 
 
 class JSONLinesFormatter(logging.Formatter):
@@ -48,27 +54,28 @@ class JSONLinesFormatter(logging.Formatter):
         super().__init__(datefmt=datefmt)
         self.whitelist = list(whitelist or [])
         self.drop_fields = set(drop_fields or [])
+        self._whitelist = tuple(self.whitelist) if self.whitelist else None
+        self._skip = _STANDARD_ATTRS | self.drop_fields
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
+        data = record.__dict__
+        level, name = _CORE_FIELDS(data)
         payload: MutableMapping[str, Any] = {
             "ts": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "name": record.name,
+            "level": level,
+            "name": name,
             "message": record.getMessage(),
         }
-        if hasattr(record, "context"):
-            payload["context"] = getattr(record, "context")
+        if "context" in data:
+            payload["context"] = data["context"]
 
         extra: dict[str, Any]
-        data = record.__dict__
-        if self.whitelist:
-            extra = {key: data[key] for key in self.whitelist if key in data}
+        if self._whitelist is not None:
+            extra = {key: data[key] for key in self._whitelist if key in data}
         else:
-            extra = {
-                key: value
-                for key, value in data.items()
-                if key not in _STANDARD_ATTRS and key not in self.drop_fields
-            }
+            skip = self._skip
+            extra = {key: value for key, value in data.items() if key not in skip}
 
         if extra:
             payload["extra"] = extra
@@ -76,4 +83,4 @@ class JSONLinesFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return self._encode(payload)
@@ -3,18 +3,51 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Any, Iterable, Mapping
 
 __all__ = ["LogFmtFormatter"]
 
 
+_SKIP_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "asctime",
+        "context",
+        "extra_kvs",
+    }
+)
+
+
+_NEEDS_QUOTE = re.compile(r'[\s="]').search
+_QUOTE_TRANS = str.maketrans({'"': '\\"'})
+
+
 def _escape(value: Any) -> str:
-    text = str(value)
+    text = value if type(value) is str else str(value)
     if not text:
         return '""'
-    if any(ch.isspace() for ch in text) or "=" in text or "\"" in text:
-        escaped = text.replace("\"", "\\\"")
-        return f'"{escaped}"'
+    if _NEEDS_QUOTE(text):
+        return f'"{text.translate(_QUOTE_TRANS)}"'
     return text
 
 
@@ -24,6 +57,8 @@ class LogFmtFormatter(logging.Formatter):
     def __init__(self, *, keys: Iterable[str] | None = None, datefmt: str | None = "%Y-%m-%dT%H:%M:%S%z") -> None:
         super().__init__(datefmt=datefmt)
         self.extra_keys = list(keys or [])
+        # ``(prefix, key)`` pairs so the fixed-key path only concatenates.
+        self._fixed_extra = tuple((f"{key}=", key) for key in self.extra_keys) if self.extra_keys else None
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         parts = [
@@ -32,44 +67,21 @@ class LogFmtFormatter(logging.Formatter):
             f"logger={_escape(record.name)}",
             f"msg={_escape(record.getMessage())}",
         ]
-        context = getattr(record, "context", None)
+        # ``__dict__`` rather than ``getattr``: ``ContextLogRecord`` carries a
+        # class-level ``"-"`` default that would otherwise tag every line.
+        data: Mapping[str, Any] = record.__dict__
+        context = data.get("context")
         if context:
             parts.append(f"context={_escape(context)}")
 
-        data: Mapping[str, Any] = record.__dict__
-        extra_keys = self.extra_keys or [
-            key
-            for key in data.keys()
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "asctime",
-                "context",
-                "extra_kvs",
-            }
-        ]
-
-        for key in extra_keys:
-            if key in data:
-                parts.append(f"{key}={_escape(data[key])}")
+        if self._fixed_extra is not None:
+            for prefix, key in self._fixed_extra:
+                if key in data:
+                    parts.append(prefix + _escape(data[key]))
+        else:
+            for key, value in data.items():
+                if key not in _SKIP_KEYS:
+                    parts.append(f"{key}={_escape(value)}")
 
         if record.exc_info:
             parts.append(f"exc={_escape(self.formatException(record.exc_info))}")
@@ -17,11 +17,19 @@ class StructuredTextFormatter(logging.Formatter):
         final_fmt = fmt or (_DEFAULT_FMT_WITH_EXTRAS if show_extras else _DEFAULT_FMT)
         super().__init__(final_fmt, datefmt=datefmt)
         self.show_extras = show_extras
+        # %-style formatting reads ``record.__dict__`` directly, so the class
+        # level defaults on ``ContextLogRecord`` are invisible to it. Only the
+        # placeholders this format actually uses need filling in.
+        defaults = (("context", "-"), ("extra_kvs", "-" if show_extras else ""))
+        self._defaults = tuple((key, value) for key, value in defaults if f"%({key})" in final_fmt)
+        self._uses_time = self._style.usesTime()
+
+    def usesTime(self) -> bool:  # type: ignore[override]
+        return self._uses_time
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
-        record.__dict__.setdefault("context", "-")
-        if self.show_extras:
-            record.__dict__.setdefault("extra_kvs", "-")
-        else:
-            record.__dict__.setdefault("extra_kvs", "")
+        data = record.__dict__
+        for key, value in self._defaults:
+            if key not in data:
+                data[key] = value
         return super().format(record)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
 from dataclasses import dataclass
 from typing import Any
@@ -10,6 +11,60 @@ from typing import Any
 __all__ = ["ConsoleHandlerConfig", "build_console_handler"]
 
 
+class _BinaryStreamHandler(logging.StreamHandler):
+    """Stream handler that writes pre-encoded bytes to the stream's buffer.
+
+    The byte path is only taken for line-buffered or write-through text
+    streams. The text layer may still hold a partial line (``print(...,
+    end="")``), so it is flushed before each byte write to keep output in
+    order. Any other stream (for example ``io.StringIO`` passed to
+    :meth:`setStream`) uses the stock text write.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__(stream)
+        self._bind(stream)
+
+    def _bind(self, stream: Any) -> None:
+        if _supports_binary_writes(stream):
+            self._write = stream.buffer.write
+            self._encoding = stream.encoding or "utf-8"
+            self._errors = stream.errors or "strict"
+        else:
+            self._write = None
+
+    def setStream(self, stream: Any) -> Any:  # type: ignore[override]
+        previous = super().setStream(stream)
+        self._bind(stream)
+        return previous
+
+    def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
+        write = self._write
+        if write is None:
+            super().emit(record)
+            return
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.flush()
+            write(msg.encode(self._encoding, self._errors))
+            self.flush()
+        except RecursionError:  # pragma: no cover - mirrors StreamHandler.emit
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _supports_binary_writes(stream: Any) -> bool:
+    # The byte path skips the text layer's newline translation, so it is only
+    # used where "\n" is already the platform line separator.
+    return (
+        os.linesep == "\n"
+        and (getattr(stream, "line_buffering", False) is True or getattr(stream, "write_through", False) is True)
+        and hasattr(getattr(stream, "buffer", None), "write")
+        and isinstance(getattr(stream, "encoding", None), str)
+    )
+
+
 @dataclass(slots=True)
 class ConsoleHandlerConfig:
     """Configuration for console handlers."""
@@ -29,6 +84,11 @@ def build_console_handler(config: ConsoleHandlerConfig | None = None) -> logging
         stream = sys.stderr
     else:
         stream = None
-    handler = logging.StreamHandler(stream=stream)
+    resolved = stream if stream is not None else sys.stderr
+    handler: logging.Handler
+    if _supports_binary_writes(resolved):
+        handler = _BinaryStreamHandler(resolved)
+    else:
+        handler = logging.StreamHandler(stream=stream)
     handler.setLevel(cfg.level)
     return handler
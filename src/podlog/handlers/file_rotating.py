@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import atexit
+import codecs
 import gzip
+import locale
 import logging
+import os
+import shutil
+import stat
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from logging.handlers import BaseRotatingHandler, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
-from typing import cast
+from typing import Any, Hashable, cast
 
 from ..utils.paths import DateFolderStrategy, build_log_path
 from ..utils.time import utcnow
@@ -49,23 +59,100 @@ class RetentionPolicy:
     compress: bool = False
 
     def apply(self, directory: Path, stem: str) -> None:
-        if not directory.exists():
+        """Prune rotated siblings of ``stem`` in ``directory``.
+
+        Each candidate is stat'ed once; the collected modification times drive
+        both the ``max_files`` and ``max_days`` checks.
+        """
+
+        try:
+            with os.scandir(directory) as entries:
+                candidates = []
+                for entry in entries:
+                    name = entry.name
+                    if name == stem or not name.startswith(stem):
+                        continue
+                    try:
+                        candidates.append((entry.stat().st_mtime, entry.path))
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
             return
-        candidates = sorted(
-            (path for path in directory.iterdir() if path.name.startswith(stem) and path.name != stem),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        candidates.sort(reverse=True)
 
         if self.max_files is not None and self.max_files >= 0:
-            for path in candidates[self.max_files :]:
-                path.unlink(missing_ok=True)
+            for _, path in candidates[self.max_files :]:
+                _unlink(path)
+            candidates = candidates[: self.max_files]
 
         if self.max_days is not None and self.max_days >= 0:
             cutoff = utcnow().timestamp() - (self.max_days * 86400)
-            for path in candidates:
-                if path.stat().st_mtime < cutoff:
-                    path.unlink(missing_ok=True)
+            for mtime, path in candidates:
+                if mtime < cutoff:
+                    _unlink(path)
+
+
+def _compress_path(path: Path, target: Path | None = None) -> None:
+    """Gzip ``path`` to ``target`` (default: next to itself) and remove the original."""
+
+    target = target or path.with_suffix(path.suffix + ".gz")
+    with path.open("rb") as src, gzip.open(target, "wb", compresslevel=1) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    path.unlink(missing_ok=True)
+
+
+def _compress_in_background(staged: Path, target: Path) -> None:
+    try:
+        _compress_path(staged, target)
+    except FileNotFoundError:
+        pass
+    except Exception:  # pragma: no cover - reported like logging.Handler.handleError
+        if logging.raiseExceptions:
+            traceback.print_exc()
+
+
+# Text-mode files translate "\n" on write; the binary path does it by hand.
+_TRANSLATE_NEWLINES = os.linesep != "\n"
+
+# Upper bound for ``close()`` waiting on background compressions.
+_DRAIN_TIMEOUT_S = 30.0
+
+# Created lazily and discarded in forked children: a child inherits the
+# executor object but not its worker thread, so submitted jobs would never run.
+_COMPRESS_EXECUTOR: ThreadPoolExecutor | None = None
+_COMPRESS_LOCK = threading.Lock()
+
+
+def _compress_executor() -> ThreadPoolExecutor:
+    global _COMPRESS_EXECUTOR
+    with _COMPRESS_LOCK:
+        if _COMPRESS_EXECUTOR is None:
+            _COMPRESS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="podlog-gz")
+        return _COMPRESS_EXECUTOR
+
+
+def _shutdown_compression() -> None:
+    executor = _COMPRESS_EXECUTOR
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _reset_compression_after_fork() -> None:
+    global _COMPRESS_EXECUTOR, _COMPRESS_LOCK
+    _COMPRESS_EXECUTOR = None
+    _COMPRESS_LOCK = threading.Lock()
+
+
+atexit.register(_shutdown_compression)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_compression_after_fork)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 
 @dataclass(slots=True)
@@ -90,11 +177,22 @@ class FileHandlerConfig:
 
 
 class _DateAwareMixin:
-    def __init__(self, *, config: FileHandlerConfig) -> None:
+    def _init_location(self, config: FileHandlerConfig) -> str:
+        """Resolve the initial log path before the stdlib handler is initialised."""
+
         self._config = config
         self._stem = config.filename
         self._current_dir = Path()
-        self._update_path(moment=utcnow())
+        self._last_bucket: Hashable | None = None
+        self._jobs: list[Future[None]] = []
+        self._jobs_pid = os.getpid()
+        # Local-time span of ``record.created`` values that map to the current
+        # folder; an empty span forces a lookup for every record.
+        self._span_start = 0.0
+        self._span_end = 0.0
+        # Records are filed by local time, so start in the local day's folder.
+        self._update_path(moment=datetime.now())
+        return self.baseFilename
 
     def _resolve_path(self, moment: datetime) -> Path:
         return build_log_path(
@@ -102,61 +200,204 @@ class _DateAwareMixin:
             self._config.filename,
             strategy=self._config.strategy,
             moment=moment,
+            ensure=False,
         )
 
     def _update_path(self, moment: datetime) -> None:
+        bucket = self._config.strategy.bucket(moment)
+        if bucket == self._last_bucket:
+            return
         target = self._resolve_path(moment)
         directory = target.parent
         directory.mkdir(parents=True, exist_ok=True)
-        if getattr(self, "baseFilename", "") != str(target):
-            self.baseFilename = str(target)
+        filename = os.path.abspath(target)
+        if getattr(self, "baseFilename", None) != filename:
             handler = cast(BaseRotatingHandler, self)
-            if getattr(handler, "stream", None):
-                handler.stream.close()
-                handler.stream = handler._open()
+            if getattr(handler, "stream", None) is None:
+                self.baseFilename = filename
+            else:
+                handler.acquire()
+                try:
+                    self.baseFilename = filename
+                    # The next emit reopens lazily at the new location.
+                    handler.stream.close()
+                    handler.stream = None  # type: ignore[assignment]
+                finally:
+                    handler.release()
         self._current_dir = directory
+        self._last_bucket = bucket
+
+    def _open_unless_delayed(self) -> None:
+        handler = cast(BaseRotatingHandler, self)
+        handler.delay = self._config.delay
+        if not handler.delay:
+            handler.stream = handler._open()
+
+    def _pending_moment(self, record: logging.LogRecord) -> datetime | None:
+        """Return the local moment of ``record`` if it belongs in another folder."""
+
+        created = record.created
+        if self._span_start <= created < self._span_end:
+            return None
+        moment = datetime.fromtimestamp(created)
+        if self._config.strategy.bucket(moment) == self._last_bucket:
+            self._set_span(moment)
+            return None
+        return moment
+
+    def _set_span(self, moment: datetime) -> None:
+        if self._config.strategy.daily:
+            start = datetime(moment.year, moment.month, moment.day)
+            self._span_start = start.timestamp()
+            self._span_end = (start + timedelta(days=1)).timestamp()
+
+    def _move_to(self, moment: datetime) -> None:
+        self._update_path(moment)
+        self._set_span(moment)
+
+    def _after_rollover(self) -> None:
+        """Hand the fresh archive to the compression thread, then apply retention.
+
+        The archive is renamed to a unique staging name first so a rollover
+        that happens before the job runs cannot shift it underneath the
+        compressor.
+        """
 
-    def _apply_retention(self) -> None:
+        if self._config.retention.compress:
+            first_archive = Path(f"{self.baseFilename}.1")
+            staged = first_archive.with_name(f"{first_archive.name}.{time.time_ns()}.tmp")
+            try:
+                first_archive.rename(staged)
+            except FileNotFoundError:
+                pass
+            else:
+                self._forget_foreign_jobs()
+                self._jobs = [job for job in self._jobs if not job.done()]
+                target = first_archive.with_suffix(first_archive.suffix + ".gz")
+                try:
+                    job = _compress_executor().submit(_compress_in_background, staged, target)
+                except RuntimeError:
+                    # The executor refuses work once interpreter shutdown has
+                    # begun (e.g. a rollover from an atexit log call).
+                    _compress_path(staged, target)
+                else:
+                    self._jobs.append(job)
         self._config.retention.apply(self._current_dir, self._config.filename)
 
+    def _forget_foreign_jobs(self) -> None:
+        # Jobs submitted before a fork belong to the parent's worker thread.
+        pid = os.getpid()
+        if pid != self._jobs_pid:
+            self._jobs = []
+            self._jobs_pid = pid
+
+    def _drain_jobs(self) -> None:
+        self._forget_foreign_jobs()
+        wait(self._jobs, timeout=_DRAIN_TIMEOUT_S)
+        self._jobs.clear()
+
+    def close(self) -> None:
+        self._drain_jobs()
+        super().close()  # type: ignore[misc]
+
+
+class _ByteRotatingFileHandler(RotatingFileHandler):
+    """Size-rotating handler that formats once and writes encoded bytes unbuffered.
+
+    The stdlib handler formats every record twice (once to size-check it in
+    ``shouldRollover``) and stats the path on each check. Here each record is
+    formatted once and written with a single ``write`` syscall; the rollover
+    check reads the size with one ``fstat`` on the open file, so appends by
+    other processes and external truncation are still seen.
+
+    Note that ``stream`` is an unbuffered *binary* file: code writing ``str``
+    to ``handler.stream`` directly must encode first.
+    """
+
+    _regular = True
+
+    def _open(self) -> Any:  # type: ignore[override]
+        stream = open(self.baseFilename, self.mode + "b", buffering=0)
+        info = os.fstat(stream.fileno())
+        # See bpo-45401: never roll over anything but regular files.
+        self._regular = stat.S_ISREG(info.st_mode)
+        encoding = self.encoding or "utf-8"
+        if encoding == "locale":
+            encoding = locale.getpreferredencoding(False)
+        encoder = codecs.getincrementalencoder(encoding)(self.errors or "strict")
+        if info.st_size:
+            # Appending: do not emit another byte-order mark.
+            encoder.setstate(0)
+        self._encode = encoder.encode
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(len(self._encode_record(record)))
 
-class DateAwareRotatingFileHandler(_DateAwareMixin, RotatingFileHandler):
+    def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
+        try:
+            if self.stream is None:
+                if self.mode == "w" and self._closed:
+                    return
+                self.stream = self._open()
+            data = self._encode_record(record)
+            if self._would_overflow(len(data)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            view = memoryview(data)
+            while view:
+                view = view[self.stream.write(view) :]
+        except RecursionError:  # pragma: no cover - mirrors StreamHandler.emit
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _encode_record(self, record: logging.LogRecord) -> bytes:
+        text = self.format(record) + self.terminator
+        if _TRANSLATE_NEWLINES:
+            text = text.replace("\n", os.linesep)
+        return self._encode(text)
+
+    def _would_overflow(self, length: int) -> bool:
+        if self.maxBytes <= 0 or not self._regular:
+            return False
+        size = os.fstat(self.stream.fileno()).st_size
+        return size > 0 and size + length >= self.maxBytes
+
+
+class DateAwareRotatingFileHandler(_DateAwareMixin, _ByteRotatingFileHandler):
     def __init__(self, *, config: FileHandlerConfig) -> None:
-        initial_path = build_log_path(config.base_dir, config.filename, strategy=config.strategy, moment=utcnow())
+        initial_path = self._init_location(config)
         rot = config.size_rotation or SizeRotation(max_bytes=10_000_000, backup_count=5)
-        RotatingFileHandler.__init__(
+        _ByteRotatingFileHandler.__init__(
             self,
             filename=initial_path,
             maxBytes=rot.max_bytes,
             backupCount=rot.backup_count,
             encoding=config.encoding,
-            delay=config.delay,
+            delay=True,
         )
-        _DateAwareMixin.__init__(self, config=config)
+        self._open_unless_delayed()
 
     def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
-        self._update_path(datetime.fromtimestamp(record.created))
+        moment = self._pending_moment(record)
+        if moment is not None:
+            self._move_to(moment)
         super().emit(record)
 
     def doRollover(self) -> None:  # type: ignore[override]
         super().doRollover()
-        if self._config.retention.compress:
-            first_archive = Path(f"{self.baseFilename}.1")
-            if first_archive.exists():
-                self._compress(first_archive)
-        self._apply_retention()
-
-    def _compress(self, path: Path) -> None:
-        target = path.with_suffix(path.suffix + ".gz")
-        with path.open("rb") as src, gzip.open(target, "wb") as dst:
-            dst.writelines(src)
-        path.unlink(missing_ok=True)
+        self._after_rollover()
 
 
 class DateAwareTimedRotatingFileHandler(_DateAwareMixin, TimedRotatingFileHandler):
     def __init__(self, *, config: FileHandlerConfig) -> None:
-        moment = utcnow()
-        initial_path = build_log_path(config.base_dir, config.filename, strategy=config.strategy, moment=moment)
+        self._pending_folder: datetime | None = None
+        self._rollover_due = False
+        initial_path = self._init_location(config)
         rot = config.time_rotation or TimeRotation()
         TimedRotatingFileHandler.__init__(
             self,
@@ -165,28 +406,32 @@ class DateAwareTimedRotatingFileHandler(_DateAwareMixin, TimedRotatingFileHandle
             interval=rot.interval,
             backupCount=rot.backup_count,
             encoding=config.encoding,
-            delay=config.delay,
+            delay=True,
             utc=rot.utc,
         )
-        _DateAwareMixin.__init__(self, config=config)
+        self._open_unless_delayed()
 
-    def emit(self, record: logging.LogRecord) -> None:  # type: ignore[override]
-        self._update_path(datetime.fromtimestamp(record.created))
-        super().emit(record)
+    def shouldRollover(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        # A new date folder is handled as a rollover: the time-based rotation
+        # (if due) runs against the old folder, then the handler moves on.
+        self._pending_folder = self._pending_moment(record)
+        self._rollover_due = TimedRotatingFileHandler.shouldRollover(self, record)
+        return self._rollover_due or self._pending_folder is not None
 
     def doRollover(self) -> None:  # type: ignore[override]
-        super().doRollover()
-        if self._config.retention.compress:
-            first_archive = Path(f"{self.baseFilename}.1")
-            if first_archive.exists():
-                self._compress(first_archive)
-        self._apply_retention()
-
-    def _compress(self, path: Path) -> None:
-        target = path.with_suffix(path.suffix + ".gz")
-        with path.open("rb") as src, gzip.open(target, "wb") as dst:
-            dst.writelines(src)
-        path.unlink(missing_ok=True)
+        pending, self._pending_folder = self._pending_folder, None
+        if self._rollover_due or pending is None:
+            self._rollover_due = False
+            delay = self.delay
+            # Skip reopening the old file when a folder change follows.
+            self.delay = delay or pending is not None
+            try:
+                super().doRollover()
+            finally:
+                self.delay = delay
+            self._after_rollover()
+        if pending is not None:
+            self._move_to(pending)
 
 
 def build_file_handler(config: FileHandlerConfig) -> logging.Handler:
@@ -4,12 +4,42 @@ from __future__ import annotations
 
 import json
 import logging
+import socket
+from contextlib import suppress
 from dataclasses import dataclass
 from logging.handlers import DatagramHandler
 
 __all__ = ["GELFUDPConfig", "GELFUDPHandler", "build_gelf_udp_handler"]
 
 _GELF_VERSION = "1.1"
+_RESERVED = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "asctime",
+        "message",
+    }
+)
+_FALLBACK_FORMATTER = logging.Formatter()
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
 
 @dataclass(slots=True)
@@ -24,6 +54,35 @@ class GELFUDPHandler(DatagramHandler):
     def __init__(self, host: str, port: int) -> None:
         super().__init__(host, port)
 
+    def makeSocket(self) -> socket.socket:  # type: ignore[override]
+        # The destination is fixed, so connect once and let ``send`` skip the
+        # per-datagram address handling of ``sendto``.
+        sock = super().makeSocket()
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def send(self, s: bytes) -> None:  # type: ignore[override]
+        if self.sock is None:
+            self.createSocket()
+        sock = self.sock
+        if sock is None:
+            return
+        try:
+            sock.send(s)
+        except ConnectionRefusedError:
+            # A previous datagram bounced; unconnected sockets never report
+            # this, so retry once and drop the record on a second refusal.
+            with suppress(ConnectionRefusedError):
+                sock.send(s)
+        except OSError:
+            self.sock = None
+            sock.close()
+            raise
+
     def makePickle(self, record: logging.LogRecord) -> bytes:  # type: ignore[override]
         payload = {
             "version": _GELF_VERSION,
@@ -33,17 +92,12 @@ class GELFUDPHandler(DatagramHandler):
             "level": record.levelno,
         }
         if record.exc_info:
-            formatter = self.formatter or logging.Formatter()
+            formatter = self.formatter or _FALLBACK_FORMATTER
             payload["full_message"] = formatter.formatException(record.exc_info)
-        extra = {
-            key: value
-            for key, value in record.__dict__.items()
-            if key not in {"name", "msg", "args", "levelname", "levelno", "pathname", "filename", "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName", "created", "msecs", "relativeCreated", "thread", "threadName", "processName", "process", "asctime"}
-        }
-        for key, value in extra.items():
-            payload[f"_{key}"] = value
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        return data
+        attrs = record.__dict__
+        for key in attrs.keys() - _RESERVED:
+            payload[f"_{key}"] = attrs[key]
+        return _encode(payload).encode("utf-8")
 
 
 def build_gelf_udp_handler(config: GELFUDPConfig | None = None) -> logging.Handler:
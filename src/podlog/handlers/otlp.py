@@ -5,10 +5,13 @@ from __future__ import annotations
 import importlib
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Mapping, cast
 
 __all__ = ["OTLPConfig", "build_otlp_handler"]
 
+
+@lru_cache(maxsize=1)
 def _load_otlp_dependencies() -> tuple[type[Any], type[Any], type[Any], type[Any], type[Any]]:
     logs_module = importlib.import_module("opentelemetry.sdk._logs")
     export_module = importlib.import_module("opentelemetry.sdk._logs.export")
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections import deque
 from dataclasses import dataclass
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
-from typing import Any, Iterable, List, cast
+from queue import Empty, Full, Queue, SimpleQueue
+from typing import Any, Deque, Iterable, List, Set, Tuple, Union, cast
 
 __all__ = ["QueueConfig", "QueueCoordinator"]
 
+# Queue items pair a record with the handler it is routed to; ``None`` means
+# every handler owned by the coordinator.
+_QueueItem = Tuple["logging.Handler | None", logging.LogRecord]
+_Queue = Union["Queue[_QueueItem]", "SimpleQueue[_QueueItem]", "_DequeQueue"]
+
 
 @dataclass(slots=True)
 class QueueConfig:
@@ -18,15 +24,31 @@ class QueueConfig:
     queue_maxsize: int = 1000
     flush_interval_ms: int = 500
     graceful_shutdown_timeout_s: float = 5.0
+    use_deque_queue: bool = False
 
 
 class QueueCoordinator:
-    """Manage a queue-based logging pipeline."""
+    """Manage a queue-based logging pipeline.
+
+    One queue and one listener thread serve every handler passed in. Use
+    :meth:`handler_for` to obtain a producer-side handler that routes records
+    to a single target, or :meth:`handler` to fan out to all of them.
+
+    Records are enqueued as-is and formatted by the handlers on the listener
+    side. ``queue_maxsize <= 0`` selects an unbounded :class:`queue.SimpleQueue`;
+    bounded queues use :class:`queue.Queue` unless ``use_deque_queue`` is set.
+    """
 
     def __init__(self, *, config: QueueConfig, handlers: Iterable[logging.Handler]) -> None:
         self.config = config
         self.handlers: List[logging.Handler] = list(handlers)
-        self.queue: Queue[logging.LogRecord] = Queue(maxsize=config.queue_maxsize)
+        self.queue: _Queue
+        if config.queue_maxsize <= 0:
+            self.queue = SimpleQueue()
+        elif config.use_deque_queue:
+            self.queue = _DequeQueue(config.queue_maxsize)
+        else:
+            self.queue = Queue(maxsize=config.queue_maxsize)
         self.queue_handler = _SafeQueueHandler(self.queue)
         self.listener = _BlockingQueueListener(
             self.queue, *self.handlers, respect_handler_level=True
@@ -58,8 +80,16 @@ class QueueCoordinator:
 
     def _flush_loop(self) -> None:
         interval = self.config.flush_interval_ms / 1000.0
+        dirty = self.listener.dirty
         while not self._stop_event.wait(interval):
-            for handler in self.handlers:
+            if not dirty:
+                continue
+            # The listener marks a handler after writing to it. Clearing each
+            # mark before flushing means a mark set after the clear survives
+            # for the next tick, and one set before it covers a write this
+            # flush includes. ``tuple``/``discard``/``add`` are atomic in CPython.
+            for handler in tuple(dirty):
+                dirty.discard(handler)
                 try:
                     handler.flush()
                 except Exception:
@@ -77,17 +107,97 @@ class QueueCoordinator:
 
         return self.queue_handler
 
+    def handler_for(self, target: logging.Handler) -> logging.Handler:
+        """Return a queue handler whose records are delivered to ``target`` only."""
+
+        if not any(handler is target for handler in self.handlers):
+            raise ValueError("target handler is not managed by this coordinator")
+        return _SafeQueueHandler(self.queue, target=target)
+
+
+class _DequeQueue:
+    """Bounded FIFO with the subset of the ``queue.Queue`` API the pipeline uses.
+
+    A deque guarded by one lock and two conditions, without the
+    ``task_done``/``join`` bookkeeping and method indirection of ``queue.Queue``.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: Deque[Any] = deque()
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        with self._not_full:
+            if len(self._items) >= self.maxsize:
+                if not block:
+                    raise Full
+                if not self._not_full.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                    raise Full
+            self._items.append(item)
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        with self._not_empty:
+            if not self._items:
+                if not block:
+                    raise Empty
+                if not self._not_empty.wait_for(lambda: self._items, timeout):
+                    raise Empty
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
 
 class _SafeQueueHandler(QueueHandler):
     """Queue handler that blocks instead of dropping records when full."""
 
+    def __init__(
+        self, queue: _Queue, *, target: logging.Handler | None = None
+    ) -> None:
+        super().__init__(queue)
+        self.target = target
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Handlers on the listener side format records themselves; the stdlib
+        # default would copy the record and flatten msg/args/exc_info first.
+        return record
+
     def enqueue(self, record: logging.LogRecord) -> None:  # type: ignore[override]
-        queue = cast(Queue[logging.LogRecord], self.queue)
-        queue.put(record, block=True)
+        queue = cast("Queue[_QueueItem]", self.queue)
+        queue.put((self.target, record), block=True)
 
 
 class _BlockingQueueListener(QueueListener):
-    """Queue listener that waits for sentinel space during shutdown."""
+    """Queue listener that routes tagged records and waits for sentinel space."""
+
+    def __init__(self, queue: Any, *handlers: logging.Handler, respect_handler_level: bool = False) -> None:
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        # Handlers written to since the flush thread last looked.
+        self.dirty: Set[logging.Handler] = set()
+
+    def handle(self, item: _QueueItem) -> None:  # type: ignore[override]
+        target, record = item
+        record = self.prepare(record)
+        targets = self.handlers if target is None else (target,)
+        for handler in targets:
+            if not self.respect_handler_level or record.levelno >= handler.level:
+                handler.handle(record)
+                self.dirty.add(handler)
 
     def enqueue_sentinel(self) -> None:  # type: ignore[override]
         # ``QueueListener`` uses ``put_nowait`` which can fail when the queue
@@ -8,6 +8,7 @@ from logging.handlers import SysLogHandler
 from pathlib import Path
 from socket import SocketKind
 from typing import Tuple
+from urllib.parse import urlsplit
 
 __all__ = ["SyslogConfig", "build_syslog_handler"]
 
@@ -26,13 +27,21 @@ def _parse_address(address: str | Tuple[str, int] | None) -> str | Tuple[str, in
         return ("localhost", 514)
     if isinstance(address, tuple):
         return address
-    if address.startswith("unix://"):
-        return str(Path(address.removeprefix("unix://")))
-    if address.startswith("udp://") or address.startswith("tcp://"):
-        _, rest = address.split("://", 1)
-        host, _, port_str = rest.partition(":")
-        port = int(port_str or "514")
-        return (host or "localhost", port)
+    if "://" not in address:
+        return address
+    parts = urlsplit(address)
+    scheme = parts.scheme
+    if scheme == "unix":
+        # Socket paths are taken verbatim: ``?`` and ``#`` are not URL syntax here.
+        return str(Path(address.split("://", 1)[1]))
+    if scheme in ("udp", "tcp"):
+        # ``parts.hostname`` lowercases, so slice the host out of ``netloc``.
+        host = parts.netloc
+        port = parts.port
+        if port is not None or host.endswith(":"):
+            host = host.rpartition(":")[0]
+        host = host.removeprefix("[").removesuffix("]")
+        return (host or "localhost", 514 if port is None else port)
     return address
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Hashable, Literal
 
 DateFolderMode = Literal["flat", "nested"]
 
@@ -25,6 +25,26 @@ class DateFolderStrategy:
     mode: DateFolderMode = "nested"
     date_format: str = "%Y-%m-%d"
 
+    def bucket(self, moment: datetime) -> Hashable:
+        """Return a key that changes exactly when the folder for ``moment`` does.
+
+        Day-granular layouts compare calendar dates; flat formats using
+        sub-day directives fall back to the rendered folder name.
+        """
+
+        if self.daily:
+            return (moment.year, moment.month, moment.day)
+        return moment.strftime(self.date_format)
+
+    @property
+    def daily(self) -> bool:
+        """Whether folders change only at calendar-day boundaries."""
+
+        return self.mode != "flat" or not any(directive in self.date_format for directive in _SUBDAY_DIRECTIVES)
+
+
+_SUBDAY_DIRECTIVES = ("%H", "%I", "%M", "%S", "%f", "%p", "%X", "%c", "%s", "%T", "%R", "%r")
+
 
 def ensure_directory(path: str | Path) -> Path:
     """Ensure the directory for ``path`` exists and return it as ``Path``."""
@@ -34,16 +54,24 @@ def ensure_directory(path: str | Path) -> Path:
     return directory
 
 
-def dated_directory(base_dir: str | Path, *, strategy: DateFolderStrategy, moment: datetime) -> Path:
-    """Return the directory for ``moment`` according to ``strategy``."""
+def dated_directory(
+    base_dir: str | Path,
+    *,
+    strategy: DateFolderStrategy,
+    moment: datetime,
+    ensure: bool = True,
+) -> Path:
+    """Return the directory for ``moment`` according to ``strategy``.
 
-    base = ensure_directory(base_dir)
-    if strategy.mode == "flat":
-        folder = strategy.date_format
-        formatted = moment.strftime(folder)
-        return ensure_directory(base / formatted)
+    Pass ``ensure=False`` when the caller creates the directory itself.
+    """
 
-    return ensure_directory(base / f"{moment.year:04d}" / f"{moment.month:02d}" / f"{moment.day:02d}")
+    base = Path(base_dir)
+    if strategy.mode == "flat":
+        directory = base / moment.strftime(strategy.date_format)
+    else:
+        directory = base / f"{moment.year:04d}" / f"{moment.month:02d}" / f"{moment.day:02d}"
+    return ensure_directory(directory) if ensure else directory
 
 
 def build_log_path(
@@ -52,8 +80,9 @@ def build_log_path(
     *,
     strategy: DateFolderStrategy,
     moment: datetime,
+    ensure: bool = True,
 ) -> Path:
     """Build the full path for a log file given the current ``moment``."""
 
-    directory = dated_directory(base_dir, strategy=strategy, moment=moment)
+    directory = dated_directory(base_dir, strategy=strategy, moment=moment, ensure=ensure)
     return directory / filename
@@ -49,3 +49,26 @@ def test_env_config_trims_values(monkeypatch: pytest.MonkeyPatch) -> None:
     config = loader.load_configuration({})
 
     assert config.root_logger.level == "DEBUG"
+
+
+def test_skip_discovery_ignores_files_and_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "podlog.toml").write_text("""[paths]\nbase_dir = \"local_logs\"\n""")
+    monkeypatch.setenv("PODLOG__PATHS__BASE_DIR", "env_logs")
+    monkeypatch.setenv("PODLOG_SKIP_DISCOVERY", "1")
+
+    config = loader.load_configuration({})
+
+    assert config.paths.base_dir == Path("logs")
+
+
+def test_cached_config_file_is_not_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "podlog.toml").write_text("""[handlers]\nenabled = [\"console\"]\n""")
+
+    first = loader.load_configuration({"paths": {"base_dir": "first"}})
+    first.raw["handlers"]["enabled"].append("bogus")
+
+    second = loader.load_configuration({"paths": {"base_dir": "second"}})
+    assert second.raw["handlers"]["enabled"] == ["console"]
+    assert second.handlers_enabled == ["console"]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+
+import pytest
+
+from podlog.handlers.console import _BinaryStreamHandler
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"msg": msg, "levelno": logging.INFO, "levelname": "INFO"})
+
+
+@pytest.mark.skipif(os.linesep != "\n", reason="byte path is disabled where newlines are translated")
+def test_binary_handler_writes_encoded_bytes_to_buffer() -> None:
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    handler = _BinaryStreamHandler(stream)
+
+    handler.handle(_record("héllo"))
+
+    assert raw.getvalue() == "héllo\n".encode("utf-8")
+
+
+@pytest.mark.skipif(os.linesep != "\n", reason="byte path is disabled where newlines are translated")
+def test_binary_handler_keeps_pending_text_first() -> None:
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", line_buffering=True)
+    handler = _BinaryStreamHandler(stream)
+
+    stream.write("Loading... ")
+    handler.handle(_record("log line"))
+    stream.write("done\n")
+
+    assert raw.getvalue() == b"Loading... log line\ndone\n"
+
+
+def test_binary_handler_falls_back_to_text_streams() -> None:
+    raw = io.BytesIO()
+    original = io.TextIOWrapper(raw, encoding="utf-8", write_through=True)
+    handler = _BinaryStreamHandler(original)
+    captured = io.StringIO()
+
+    handler.setStream(captured)
+    handler.handle(_record("captured"))
+
+    assert captured.getvalue() == "captured\n"
+    assert raw.getvalue() == b""
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
+import logging
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from podlog import api
+from podlog.core.context import ContextLogRecord
 from podlog.core.manager import GLOBAL_MANAGER
+from podlog.formatters.csvfmt import CSVFormatter
+from podlog.formatters.logfmt import LogFmtFormatter
 
 
 def _dated_folder(base_dir: Path) -> Path:
@@ -57,3 +63,48 @@ def test_context_and_formatters(tmp_path: Path) -> None:
     json_record = json.loads(json_path.read_text(encoding="utf-8").strip())
     assert json_record["context"] == "request_id=abc123"
     assert json_record["extra"]["order"] == 42
+
+
+def test_context_adapter_skips_process_for_disabled_levels(monkeypatch: pytest.MonkeyPatch) -> None:
+    api.configure({})
+    logger = api.get_context_logger("tests.disabled", request_id="abc123")
+    calls: list[str] = []
+    monkeypatch.setattr(logger, "process", lambda msg, kwargs: calls.append(msg) or (msg, kwargs))
+
+    logger.debug("not emitted")
+
+    assert calls == []
+
+
+def test_buffered_extras_render_live_values() -> None:
+    api.configure({})
+    logger = api.get_context_logger("tests.extras")
+
+    assert logger.process("msg", {})[1]["extra"]["extra_kvs"] == ""
+
+    items: list[int] = []
+    logger.add_extra(items=items, order=42)
+    assert logger.process("msg", {})[1]["extra"]["extra_kvs"] == "items=[] order=42"
+    items.append(1)
+    assert logger.process("msg", {})[1]["extra"]["extra_kvs"] == "items=[1] order=42"
+
+
+def test_context_renders_live_values() -> None:
+    api.configure({})
+    tags = ["a"]
+    logger = api.get_context_logger("tests.context", tags=tags)
+
+    assert logger.process("msg", {})[1]["extra"]["context"] == "tags=['a']"
+    tags.append("b")
+    assert logger.process("msg", {})[1]["extra"]["context"] == "tags=['a', 'b']"
+
+
+def test_plain_records_have_no_context_field() -> None:
+    record = ContextLogRecord("plain", logging.INFO, __file__, 1, "hello", None, None)
+
+    assert "context=" not in LogFmtFormatter().format(record)
+    assert CSVFormatter(fields=["context", "message"]).format(record) == ",hello"
+
+    record.context = "req-1"
+    assert "context=req-1" in LogFmtFormatter().format(record)
+    assert CSVFormatter(fields=["context", "message"]).format(record) == "req-1,hello"
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import gzip
 import logging
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from podlog.handlers import file_rotating
 from podlog.handlers.file_rotating import (
     FileHandlerConfig,
     RetentionPolicy,
     SizeRotation,
+    TimeRotation,
     build_file_handler,
 )
 from podlog.utils.paths import DateFolderStrategy
@@ -38,3 +49,162 @@ def test_rotation_and_retention(tmp_path: Path) -> None:
     gz_archives = [p for p in archives if p.suffix.endswith("gz")]
     assert len(archives) <= 2
     assert gz_archives, "Expected compressed archives to be present"
+
+
+@pytest.mark.parametrize("time_rotation", [None, TimeRotation()])
+def test_records_follow_their_local_day_folder(tmp_path: Path, time_rotation: TimeRotation | None) -> None:
+    strategy = DateFolderStrategy(mode="flat", date_format="%Y%m%d")
+    config = FileHandlerConfig(base_dir=tmp_path, filename="app.log", strategy=strategy, time_rotation=time_rotation)
+    handler = build_file_handler(config)
+    first = datetime(2024, 3, 1, 23, 59, 59).timestamp()
+    try:
+        for created, msg in ((first, "late"), (first + 0.5, "later"), (first + 1, "next day")):
+            record = logging.makeLogRecord({"msg": msg, "levelno": logging.INFO, "levelname": "INFO"})
+            record.created = created
+            handler.handle(record)
+    finally:
+        handler.close()
+
+    assert (tmp_path / "20240301" / "app.log").read_text(encoding="utf-8").splitlines() == ["late", "later"]
+    assert (tmp_path / "20240302" / "app.log").read_text(encoding="utf-8").splitlines() == ["next day"]
+    assert sorted(p.name for p in (tmp_path / "20240302").iterdir()) == ["app.log"]
+
+
+def test_size_rotation_counts_encoded_bytes_across_reopen(tmp_path: Path) -> None:
+    strategy = DateFolderStrategy(mode="flat", date_format="%Y%m%d")
+    config = FileHandlerConfig(
+        base_dir=tmp_path,
+        filename="app.log",
+        strategy=strategy,
+        size_rotation=SizeRotation(max_bytes=60, backup_count=3),
+    )
+    for _ in range(2):
+        handler = build_file_handler(config)
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "é" * 10}))
+        finally:
+            handler.close()
+
+    folder = next(tmp_path.iterdir())
+    assert (folder / "app.log").read_text(encoding="utf-8").splitlines() == ["é" * 10] * 2
+    handler = build_file_handler(config)
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "é" * 10}))
+    finally:
+        handler.close()
+    assert (folder / "app.log.1").read_text(encoding="utf-8").splitlines() == ["é" * 10] * 2
+    assert (folder / "app.log").read_text(encoding="utf-8").splitlines() == ["é" * 10]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_compression_works_in_forked_child(tmp_path: Path) -> None:
+    strategy = DateFolderStrategy(mode="flat", date_format="%Y%m%d")
+    config = FileHandlerConfig(
+        base_dir=tmp_path,
+        filename="app.log",
+        strategy=strategy,
+        size_rotation=SizeRotation(max_bytes=1024, backup_count=5),
+        retention=RetentionPolicy(compress=True),
+    )
+    handler = build_file_handler(config)
+    record = logging.makeLogRecord({"msg": "x" * 50})
+    handler.handle(record)
+    handler.doRollover()  # starts the parent's compression thread
+    handler.handle(record)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            handler.doRollover()
+            handler.close()
+            folder = Path(handler.baseFilename).parent
+            os._exit(0 if not list(folder.glob("*.tmp")) else 1)
+        finally:
+            os._exit(2)
+
+    try:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            time.sleep(0.05)
+        else:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            pytest.fail("forked child hung while closing the handler")
+        assert os.waitstatus_to_exitcode(status) == 0
+    finally:
+        handler.close()
+
+
+def _size_config(tmp_path: Path, max_bytes: int = 1024, **kwargs: Any) -> FileHandlerConfig:
+    return FileHandlerConfig(
+        base_dir=tmp_path,
+        filename="app.log",
+        strategy=DateFolderStrategy(mode="flat", date_format="%Y%m%d"),
+        size_rotation=SizeRotation(max_bytes=max_bytes, backup_count=3),
+        **kwargs,
+    )
+
+
+def test_delayed_size_handler_opens_on_first_record(tmp_path: Path) -> None:
+    handler = build_file_handler(_size_config(tmp_path, delay=True))
+    path = Path(handler.baseFilename)
+    try:
+        assert not path.exists()
+        handler.handle(logging.makeLogRecord({"msg": "first"}))
+    finally:
+        handler.close()
+    assert path.read_text(encoding="utf-8") == "first\n"
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-8-sig"])
+def test_bom_encodings_write_a_single_mark_across_reopen(tmp_path: Path, encoding: str) -> None:
+    for msg in ("one", "two"):
+        handler = build_file_handler(_size_config(tmp_path, encoding=encoding))
+        try:
+            handler.handle(logging.makeLogRecord({"msg": msg}))
+        finally:
+            handler.close()
+
+    path = Path(handler.baseFilename)
+    assert path.read_text(encoding=encoding).splitlines() == ["one", "two"]
+
+
+def test_size_check_sees_external_truncation_and_appends(tmp_path: Path) -> None:
+    handler = build_file_handler(_size_config(tmp_path, max_bytes=40))
+    path = Path(handler.baseFilename)
+    record = logging.makeLogRecord({"msg": "x" * 9})
+    try:
+        handler.handle(record)
+        handler.handle(record)
+        handler.handle(record)
+        os.truncate(path, 0)  # copytruncate-style rotation by another tool
+        handler.handle(record)
+        assert not path.with_name("app.log.1").exists()
+
+        with path.open("ab") as other:
+            other.write(b"y" * 30)
+        handler.handle(record)
+        assert path.with_name("app.log.1").exists()
+    finally:
+        handler.close()
+
+
+def test_compression_runs_inline_once_executor_refuses_work(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+    executor.shutdown()
+    monkeypatch.setattr(file_rotating, "_COMPRESS_EXECUTOR", executor)
+    handler = build_file_handler(_size_config(tmp_path, retention=RetentionPolicy(compress=True)))
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "x" * 50}))
+        handler.doRollover()
+        folder = Path(handler.baseFilename).parent
+        assert not list(folder.glob("*.tmp"))
+        with gzip.open(folder / "app.log.1.gz", "rt") as archive:
+            assert archive.read().startswith("x" * 50)
+    finally:
+        handler.close()
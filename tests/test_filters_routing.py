@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
+import pytest
+
 from podlog import api
+from podlog.config.schema import FilterSpec
 from podlog.core.manager import GLOBAL_MANAGER
+from podlog.core.registry import build_filter, build_filters
 
 
 def test_filters_route_records(tmp_path: Path) -> None:
@@ -50,3 +55,41 @@ def test_filters_route_records(tmp_path: Path) -> None:
     assert not any("warning message" in line for line in info_lines)
     assert any("warning message" in line for line in warn_lines)
     assert not any("info message" in line for line in warn_lines)
+
+
+@pytest.mark.parametrize("use_queue_listener", [False, True])
+def test_filters_added_after_configure_apply(tmp_path: Path, use_queue_listener: bool) -> None:
+    overrides = {
+        "paths": {"base_dir": str(tmp_path), "date_folder_mode": "flat"},
+        "formatters": {"text": {"base": {}}},
+        "handlers": {
+            "enabled": ["app_file"],
+            "app_file": {"type": "file", "formatter": "text.base", "filename": "app.log"},
+        },
+        "logging": {"root": {"level": "INFO", "handlers": ["app_file"]}},
+        "async": {"use_queue_listener": use_queue_listener},
+    }
+
+    api.configure(overrides)
+    for handler in logging.getLogger().handlers:
+        handler.addFilter(lambda record: "secret" not in record.getMessage())
+    logger = api.get_logger("tests.filters")
+    logger.info("public message")
+    logger.info("secret message")
+    GLOBAL_MANAGER.shutdown()
+
+    folder = next(tmp_path.iterdir())
+    contents = (folder / "app.log").read_text(encoding="utf-8")
+    assert "public message" in contents
+    assert "secret message" not in contents
+
+
+def test_identical_filter_specs_share_only_within_one_build() -> None:
+    spec = FilterSpec(name="warn", kind="min", params={"level": "WARNING"})
+    twin = FilterSpec(name="warn_too", kind="min", params={"level": "WARNING"})
+
+    assert build_filter(spec) is not build_filter(spec)
+
+    filters = build_filters({"warn": spec, "warn_too": twin})
+    assert filters["warn"] is filters["warn_too"]
+    assert build_filters({"warn": spec})["warn"] is not filters["warn"]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import logging
+import socket
+from typing import Iterator, List
+
+import pytest
+
+from podlog.handlers.gelf_udp import GELFUDPHandler
+
+
+@pytest.fixture
+def receiver() -> Iterator[socket.socket]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(5.0)
+    yield sock
+    sock.close()
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("gelf.test", logging.WARNING, __file__, 1, message, None, None)
+
+
+def test_gelf_sends_over_connected_socket(receiver: socket.socket) -> None:
+    handler = GELFUDPHandler("127.0.0.1", receiver.getsockname()[1])
+    try:
+        handler.emit(_record("first"))
+        handler.emit(_record("second"))
+        assert handler.sock is not None
+        assert handler.sock.getpeername() == receiver.getsockname()
+
+        payloads = [json.loads(receiver.recv(65535)) for _ in range(2)]
+    finally:
+        handler.close()
+
+    assert [payload["short_message"] for payload in payloads] == ["first", "second"]
+    assert payloads[0]["level"] == logging.WARNING
+    assert payloads[0]["host"] == "gelf.test"
+
+
+def test_gelf_survives_closed_port(receiver: socket.socket) -> None:
+    port = receiver.getsockname()[1]
+    receiver.close()
+    handler = GELFUDPHandler("127.0.0.1", port)
+    errors: List[logging.LogRecord] = []
+    handler.handleError = errors.append  # type: ignore[method-assign]
+    try:
+        # Each datagram to the closed port queues an ICMP error that the next
+        # send on the connected socket reports as ``ConnectionRefusedError``.
+        for index in range(5):
+            handler.emit(_record(f"lost {index}"))
+        assert errors == []
+        assert handler.sock is not None
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as reopened:
+            reopened.bind(("127.0.0.1", port))
+            reopened.settimeout(5.0)
+            handler.emit(_record("delivered"))
+            payload = json.loads(reopened.recv(65535))
+    finally:
+        handler.close()
+
+    assert payload["short_message"] == "delivered"
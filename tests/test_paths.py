@@ -20,3 +20,19 @@ def test_build_log_path_flat(tmp_path: Path) -> None:
     path = build_log_path(tmp_path, "audit.log", strategy=strategy, moment=moment)
     assert path.parent == tmp_path / "20231231"
     assert path.name == "audit.log"
+
+
+def test_strategy_bucket_tracks_folder_granularity() -> None:
+    daily = DateFolderStrategy(mode="flat", date_format="%Y%m%d")
+    hourly = DateFolderStrategy(mode="flat", date_format="%Y%m%d-%H")
+    morning = datetime(2023, 5, 6, 8)
+    evening = datetime(2023, 5, 6, 20)
+    assert daily.bucket(morning) == daily.bucket(evening)
+    assert hourly.bucket(morning) != hourly.bucket(evening)
+
+
+def test_build_log_path_without_ensure(tmp_path: Path) -> None:
+    strategy = DateFolderStrategy(mode="nested")
+    path = build_log_path(tmp_path, "app.log", strategy=strategy, moment=datetime(2023, 1, 2), ensure=False)
+    assert path == tmp_path / "2023" / "01" / "02" / "app.log"
+    assert not path.parent.exists()
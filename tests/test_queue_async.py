@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from queue import SimpleQueue
+
+import pytest
 
 from podlog import api
 from podlog.core.manager import GLOBAL_MANAGER
 
 
-def test_queue_shutdown_flushes(tmp_path: Path) -> None:
+@pytest.mark.parametrize("use_deque_queue", [False, True])
+def test_queue_shutdown_flushes(tmp_path: Path, use_deque_queue: bool) -> None:
     overrides = {
         "paths": {"base_dir": str(tmp_path), "date_folder_mode": "flat"},
         "formatters": {"text": {"base": {}}},
@@ -27,6 +31,7 @@ def test_queue_shutdown_flushes(tmp_path: Path) -> None:
             "queue_maxsize": 5,
             "flush_interval_ms": 10,
             "graceful_shutdown_timeout_s": 1.0,
+            "use_deque_queue": use_deque_queue,
         },
     }
 
@@ -40,3 +45,57 @@ def test_queue_shutdown_flushes(tmp_path: Path) -> None:
     folder = next(tmp_path.iterdir())
     contents = (folder / "queue.log").read_text(encoding="utf-8").strip().splitlines()
     assert len(contents) == 20
+
+
+def test_shared_queue_routes_records_per_handler(tmp_path: Path) -> None:
+    overrides = {
+        "paths": {"base_dir": str(tmp_path), "date_folder_mode": "flat"},
+        "formatters": {"text": {"base": {}}},
+        "handlers": {
+            "enabled": ["app_file", "audit_file"],
+            "app_file": {"type": "file", "formatter": "text.base", "filename": "app.log"},
+            "audit_file": {"type": "file", "formatter": "text.base", "filename": "audit.log"},
+        },
+        "logging": {
+            "root": {"level": "INFO", "handlers": ["app_file"]},
+            "loggers": {"audit": {"level": "INFO", "handlers": ["audit_file"]}},
+        },
+        "async": {"use_queue_listener": True, "flush_interval_ms": 10},
+    }
+
+    api.configure(overrides)
+    assert len(GLOBAL_MANAGER._coordinators) == 1
+    api.get_logger("tests.app").info("app event")
+    api.get_logger("audit").info("audit event")
+    GLOBAL_MANAGER.shutdown()
+
+    folder = next(tmp_path.iterdir())
+    assert "audit event" not in (folder / "app.log").read_text(encoding="utf-8")
+    assert "app event" not in (folder / "audit.log").read_text(encoding="utf-8")
+    assert "audit event" in (folder / "audit.log").read_text(encoding="utf-8")
+
+
+def test_unbounded_queue_keeps_exception_info(tmp_path: Path) -> None:
+    overrides = {
+        "paths": {"base_dir": str(tmp_path), "date_folder_mode": "flat"},
+        "formatters": {"jsonl": {"base": {}}},
+        "handlers": {
+            "enabled": ["queue_file"],
+            "queue_file": {"type": "file", "formatter": "jsonl.base", "filename": "queue.jsonl"},
+        },
+        "logging": {"root": {"level": "INFO", "handlers": ["queue_file"]}},
+        "async": {"use_queue_listener": True, "queue_maxsize": 0, "flush_interval_ms": 10},
+    }
+
+    api.configure(overrides)
+    assert isinstance(GLOBAL_MANAGER._coordinators["default"].queue, SimpleQueue)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        api.get_logger("tests.queue").exception("failed %s", "call")
+    GLOBAL_MANAGER.shutdown()
+
+    folder = next(tmp_path.iterdir())
+    line = (folder / "queue.jsonl").read_text(encoding="utf-8").strip()
+    assert '"message":"failed call"' in line
+    assert "RuntimeError: boom" in line
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from podlog.handlers.syslog import _parse_address
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        (None, ("localhost", 514)),
+        (("collector", 601), ("collector", 601)),
+        ("/dev/log", "/dev/log"),
+        ("unix:///dev/log", "/dev/log"),
+        ("unix:///run/log?sock#1", "/run/log?sock#1"),
+        ("udp://LogHost:1514", ("LogHost", 1514)),
+        ("udp://host:0", ("host", 0)),
+        ("tcp://host:", ("host", 514)),
+        ("tcp://:601", ("localhost", 601)),
+        ("udp://", ("localhost", 514)),
+        ("tcp://[::1]:5514", ("::1", 5514)),
+    ],
+)
+def test_parse_address(address: object, expected: object) -> None:
+    assert _parse_address(address) == expected  # type: ignore[arg-type]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from podlog.config.schema import build_config, default_config
+from podlog.core.manager import GLOBAL_MANAGER
+from podlog.core.validation import ConfigurationError, validate_configuration
+
+
+def test_validation_reports_all_problems() -> None:
+    data = default_config()
+    data["handlers"]["console"]["formatter"] = "text.missing"
+    data["handlers"]["console"]["filters"] = ["nope"]
+    data["logging"]["loggers"] = {"app": {"handlers": ["ghost"]}}
+
+    with pytest.raises(ConfigurationError) as excinfo:
+        validate_configuration(build_config(data))
+
+    message = str(excinfo.value)
+    assert "unknown formatter 'text.missing'" in message
+    assert "unknown filter 'nope'" in message
+    assert "Logger 'app' references unknown handler 'ghost'" in message
+
+
+def test_reconfigure_picks_up_changed_levels() -> None:
+    config = build_config(default_config())
+    GLOBAL_MANAGER.configure(config)
+    assert logging.getLogger().level == logging.INFO
+
+    config.levels.root_level = "ERROR"
+    GLOBAL_MANAGER.configure(config)
+    assert logging.getLogger().level == logging.ERROR